@@ -9,7 +9,7 @@ Design notes:
 """
 
 # Database helpers (connection and initialization)
-from .database import get_connection, create_tables, init_db
+from .database import get_connection, close_connections, create_tables, init_db
 
 # Event-related operations
 from .events import (
@@ -17,37 +17,43 @@ from .events import (
     update_event,
     delete_event,
     list_events,
+    iter_events,
     search_events,
 )
 
 # Collateral (item) operations
 from .collaterals import (
     create_collateral,
+    bulk_create_collateral,
     update_collateral,
     delete_collateral,
     spend_collateral,
+    bulk_spend_collateral,
     get_item_summary,
+    iter_item_summary,
     get_transactions,
+    iter_transactions,
 )
 
 # Simple logging helpers (separate logs DB)
-from .logs import log_action, view_logs
+from .logs import log_action, flush_logs, view_logs, iter_logs
 
 # Summary / reports helpers
-from .summary import show_summary
+from .summary import show_summary, snapshot, invalidate_summary
 
 
 __all__ = [
     # database
-    'get_connection', 'create_tables', 'init_db',
+    'get_connection', 'close_connections', 'create_tables', 'init_db',
     # events
-    'create_event', 'update_event', 'delete_event', 'list_events', 'search_events',
+    'create_event', 'update_event', 'delete_event', 'list_events', 'iter_events', 'search_events',
     # collaterals
-    'create_collateral', 'update_collateral', 'delete_collateral', 'spend_collateral',
-    'get_item_summary', 'get_transactions',
+    'create_collateral', 'bulk_create_collateral', 'update_collateral', 'delete_collateral',
+    'spend_collateral', 'bulk_spend_collateral', 'get_item_summary', 'iter_item_summary',
+    'get_transactions', 'iter_transactions',
     # logs
-    'log_action', 'view_logs',
+    'log_action', 'flush_logs', 'view_logs', 'iter_logs',
     # reports
-    'show_summary',
+    'show_summary', 'snapshot', 'invalidate_summary',
 ]
 
@@ -1,93 +1,194 @@
 """Collateral-related operations.
 
-Provides create, update, delete and summary operations for items.
+Provides create (single and bulk), update, delete, spend (single and bulk)
+and summary operations for items.
 """
-from typing import List, Tuple, Optional
-import datetime
-from .database import get_connection
+from typing import Iterator, List, Tuple, Optional, Sequence
+import sqlite3
+from .database import HAS_RETURNING, get_connection, iter_rows
+from .summary import invalidate_summary, cache_generation
+
+# hot statements kept as constants so every call hands sqlite3 the same
+# SQL text and hits the connection's prepared-statement cache
+_ADJUST_QTY_SQL = (
+    "UPDATE collaterals SET quantity=MAX(IFNULL(quantity, 0) + ?, 0), "
+    "last_modified=strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime') WHERE id=?"
+)
+_SPEND_SQL = _ADJUST_QTY_SQL + " RETURNING quantity"
+_INSERT_ITEM_SQL = (
+    "INSERT INTO collaterals (item_name, quantity, event_id, last_modified) "
+    "VALUES (?, ?, ?, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))"
+)
+_INSERT_TX_SQL = "INSERT INTO transactions (item_id, event_id, delta, timestamp) VALUES (?, ?, ?, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))"
+
+# rows per multi-row INSERT in bulk_create_collateral; 3 parameters per row
+# keeps each statement under SQLite's historic 999-variable limit
+_BULK_CHUNK = 300
+
+# (cache_generation(), rows) of the last get_item_summary result; every write
+# here calls invalidate_summary, which moves the generation on
+_item_summary_cache = None
 
 
 def create_collateral(item_name: str, quantity: int, event_id: Optional[int] = None) -> int:
     """Insert a new collateral and return its id."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO collaterals (item_name, quantity, event_id, last_modified)
-        VALUES (?, ?, ?, ?)
-        """,
-        (item_name, quantity, event_id, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-    )
-    conn.commit()
-    last_id = cur.lastrowid
-    conn.close()
+    params = (item_name, quantity, event_id)
+    with conn:
+        if HAS_RETURNING:
+            last_id = conn.execute(_INSERT_ITEM_SQL + " RETURNING id", params).fetchone()[0]
+        else:
+            last_id = conn.execute(_INSERT_ITEM_SQL, params).lastrowid
+    invalidate_summary()
     return last_id
 
 
+def _bulk_insert_sql(n: int) -> str:
+    values = ", ".join(["(?, ?, ?, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))"] * n)
+    return f"INSERT INTO collaterals (item_name, quantity, event_id, last_modified) VALUES {values}"
+
+
+_BULK_INSERT_SQL = _bulk_insert_sql(_BULK_CHUNK)
+
+
+def bulk_create_collateral(rows: Sequence[Tuple[str, int, Optional[int]]]) -> int:
+    """Insert many (item_name, quantity, event_id) rows in one transaction.
+
+    Rows are sent as multi-row INSERT statements of up to _BULK_CHUNK rows.
+    Returns the number of rows inserted.
+    """
+    rows = list(rows)
+    conn = get_connection()
+    with conn:
+        for start in range(0, len(rows), _BULK_CHUNK):
+            chunk = rows[start:start + _BULK_CHUNK]
+            sql = _BULK_INSERT_SQL if len(chunk) == _BULK_CHUNK else _bulk_insert_sql(len(chunk))
+            conn.execute(sql, [v for row in chunk for v in row])
+    invalidate_summary()
+    return len(rows)
+
+
 def update_collateral(item_id: int, item_name: str, quantity: int, event_id: Optional[int] = None) -> None:
     """Update a collateral record."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        UPDATE collaterals
-        SET item_name=?, quantity=?, event_id=?, last_modified=?
-        WHERE id=?
-        """,
-        (item_name, quantity, event_id, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), item_id),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            """
+            UPDATE collaterals
+            SET item_name=?, quantity=?, event_id=?, last_modified=strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+            WHERE id=?
+            """,
+            (item_name, quantity, event_id, item_id),
+        )
+    invalidate_summary()
 
 
 def delete_collateral(item_id: int) -> None:
     """Delete a collateral by id."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM collaterals WHERE id=?", (item_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM collaterals WHERE id=?", (item_id,))
+    invalidate_summary()
 
 
 def spend_collateral(item_id: int, delta: int, event_id: Optional[int] = None) -> int:
     """Adjust an item's quantity by delta and record transaction. Returns new quantity."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("SELECT quantity FROM collaterals WHERE id=?", (item_id,))
-    cur_row = cur.fetchone()
-    if not cur_row:
-        conn.close()
-        raise ValueError("Item not found")
-    new_qty = max((cur_row[0] or 0) + delta, 0)
-    cur.execute("UPDATE collaterals SET quantity=?, last_modified=? WHERE id=?", (new_qty, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), item_id))
-    cur.execute("INSERT INTO transactions (item_id, event_id, delta, timestamp) VALUES (?, ?, ?, ?)", (item_id, event_id, delta, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
-    conn.commit()
-    conn.close()
-    return new_qty
-
-
-def get_item_summary() -> List[Tuple[int, str, int, Optional[int], Optional[str]]]:
-    """Return summary rows: (id, name, qty, last_event, last_time)."""
-    conn = get_connection()
-    cur = conn.cursor()
-    rows = cur.execute("SELECT id, item_name, quantity, last_modified FROM collaterals ORDER BY id DESC").fetchall()
-    summary = []
-    for r in rows:
-        last_tx = cur.execute("SELECT event_id, timestamp FROM transactions WHERE item_id=? AND delta<0 ORDER BY id DESC LIMIT 1", (r[0],)).fetchone()
-        last_event = last_tx[0] if last_tx else None
-        last_time = last_tx[1] if last_tx else r[3]
-        summary.append((r[0], r[1], r[2], last_event, last_time))
-    conn.close()
-    return summary
-
-
-def get_transactions(item_id: int) -> List[Tuple[int, int, str, Optional[str]]]:
-    """Return transactions for an item with optional event name."""
+    with conn:
+        if HAS_RETURNING:
+            # the UPDATE both checks the item exists and reports the new quantity
+            row = conn.execute(_SPEND_SQL, (delta, item_id)).fetchone()
+        elif conn.execute(_ADJUST_QTY_SQL, (delta, item_id)).rowcount:
+            row = conn.execute("SELECT quantity FROM collaterals WHERE id=?", (item_id,)).fetchone()
+        else:
+            row = None
+        if not row:
+            raise ValueError("Item not found")
+        conn.execute(_INSERT_TX_SQL, (item_id, event_id, delta))
+    invalidate_summary()
+    return row[0]
+
+
+def bulk_spend_collateral(items: Sequence[Tuple[int, int, Optional[int]]]) -> List[int]:
+    """Apply (item_id, delta, event_id) adjustments in a single transaction.
+
+    Entries are applied in order (an item may appear more than once) and
+    quantities are clamped at zero by SQL, exactly as in `spend_collateral`.
+    Returns each entry's item quantity after the whole batch; raises
+    ValueError if any item is missing, in which case nothing is written.
+    """
+    items = list(items)
+    if not items:
+        return []
     conn = get_connection()
-    cur = conn.cursor()
-    rows = cur.execute(
+    with conn:
+        cur = conn.cursor()
+        cur.executemany(_ADJUST_QTY_SQL, [(delta, item_id) for item_id, delta, _ in items])
+        if cur.rowcount != len(items):
+            raise ValueError("Item not found")
+        cur.executemany(_INSERT_TX_SQL, [(item_id, event_id, delta) for item_id, delta, event_id in items])
+        ids = list({it[0] for it in items})
+        placeholders = ", ".join("?" * len(ids))
+        qty = dict(cur.execute(f"SELECT id, quantity FROM collaterals WHERE id IN ({placeholders})", ids).fetchall())
+    invalidate_summary()
+    return [qty[it[0]] for it in items]
+
+
+def iter_item_summary() -> Iterator[sqlite3.Row]:
+    """Stream summary rows: (id, item_name, quantity, last_event, last_time).
+
+    Rows are sqlite3.Row objects, so the columns can also be read by name.
+    """
+    # SQLite takes the bare event_id/timestamp columns from the MAX(id) row,
+    # i.e. the latest spend per item, so the whole summary is one query
+    return iter_rows(
+        """
+        SELECT c.id, c.item_name, c.quantity, t.event_id AS last_event,
+               COALESCE(t.timestamp, c.last_modified) AS last_time
+        FROM collaterals c
+        LEFT JOIN (
+            SELECT item_id, event_id, timestamp, MAX(id)
+            FROM transactions
+            WHERE delta<0
+            GROUP BY item_id
+        ) t ON t.item_id = c.id
+        ORDER BY c.id DESC
+        """
+    )
+
+
+def get_item_summary(gen: Optional[int] = None) -> List[sqlite3.Row]:
+    """Return summary rows as sqlite3.Row: (id, item_name, quantity, last_event, last_time).
+
+    The result is cached until the next write that invalidates the summary.
+    gen: the cache_generation() taken before the caller's read transaction
+    began, so rows read from an older snapshot are never stored as current.
+    """
+    global _item_summary_cache
+    current = cache_generation()
+    if gen is None:
+        gen = current
+    cached = _item_summary_cache
+    if cached is not None and cached[0] == current:
+        return list(cached[1])
+    rows = list(iter_item_summary())
+    # a write during the query moves the generation on; don't store then
+    if cache_generation() == gen:
+        _item_summary_cache = (gen, rows)
+    return list(rows)
+
+
+def iter_transactions(item_id: int) -> Iterator[sqlite3.Row]:
+    """Stream an item's (id, delta, timestamp, event_name) rows as sqlite3.Row."""
+    return iter_rows(
         "SELECT t.id, t.delta, t.timestamp, e.event_name FROM transactions t LEFT JOIN events e ON t.event_id = e.id WHERE t.item_id=? ORDER BY t.id DESC",
         (item_id,),
-    ).fetchall()
-    conn.close()
-    return rows
+    )
+
+
+def get_transactions(item_id: int) -> List[sqlite3.Row]:
+    """Return an item's (id, delta, timestamp, event_name) rows as sqlite3.Row.
+
+    event_name is None for adjustments not tied to an event.
+    """
+    return list(iter_transactions(item_id))
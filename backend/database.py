@@ -1,36 +1,133 @@
 """Database helpers for the TDD Inventory System.
 
 Provides a connection factory and the function to create necessary tables.
+Every connection also has the logs database attached as schema `logs`.
 """
+import atexit
 import os
 import sqlite3
+import threading
 from typing import Iterator
 
 DB_PATH = os.path.join('data', 'inventory.db')
 LOG_DB_PATH = os.path.join('data', 'logs.db')
 
+# one cached connection per (Thread, path). Keyed on the Thread object, not
+# its ident, so a new thread never inherits a finished thread's connection;
+# those are closed the next time any thread opens a connection
+_conns = {}
+_open_lock = threading.Lock()
+
+# applied once to every new connection (after attaching logs): 8 KB pages,
+# WAL journal with relaxed fsync, in-memory temp tables, 64 MB page cache
+# and 256 MB of memory-mapped I/O. page_size only takes effect on a brand
+# new file (existing databases need a VACUUM) and must precede journal_mode.
+_PRAGMAS = """
+PRAGMA page_size=8192;
+PRAGMA logs.page_size=8192;
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+PRAGMA logs.journal_mode=WAL;
+PRAGMA logs.synchronous=NORMAL;
+"""
+
+# INSERT/UPDATE ... RETURNING needs SQLite 3.35; older libraries take the
+# lastrowid / follow-up SELECT paths in events and collaterals instead
+HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# stored in PRAGMA user_version once create_tables has run; bump it whenever
+# the DDL below changes so existing databases pick up the new objects
+SCHEMA_VERSION = 4
+
+
+def _open(path: str) -> sqlite3.Connection:
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, cached_statements=256)
+    # rows support both index and column-name access (r[0] / r['id'])
+    conn.row_factory = sqlite3.Row
+    os.makedirs(os.path.dirname(LOG_DB_PATH), exist_ok=True)
+    conn.execute("ATTACH DATABASE ? AS logs", (LOG_DB_PATH,))
+    conn.executescript(_PRAGMAS)
+    return conn
+
 
 def get_connection(path: str = None) -> sqlite3.Connection:
-    """Return a sqlite3 connection to the inventory database.
+    """Return the shared sqlite3 connection to the inventory database.
 
     If path is not provided, uses the default `data/inventory.db`.
-    Caller should close the connection when finished.
+    The connection is opened lazily on first use and reused for later calls
+    from the same thread, so callers must not close it.
+    """
+    key = (threading.current_thread(), path or DB_PATH)
+    conn = _conns.get(key)
+    if conn is None:
+        conn = _open(key[1])
+        with _open_lock:
+            dead = [k for k in _conns if not k[0].is_alive()]
+            stale = [_conns.pop(k) for k in dead]
+            _conns[key] = conn
+        for old in stale:
+            old.close()
+    return conn
+
+
+def close_connections():
+    """Close the calling thread's connections handed out by `get_connection`.
+
+    Connections other threads are using stay open; a later `get_connection`
+    call from this thread opens a fresh connection.
+    """
+    me = threading.current_thread()
+    with _open_lock:
+        mine = [_conns.pop(k) for k in [k for k in _conns if k[0] is me]]
+    for conn in mine:
+        conn.close()
+
+
+def _close_all_connections():
+    # interpreter shutdown: close every thread's connections
+    with _open_lock:
+        conns = list(_conns.values())
+        _conns.clear()
+    for conn in conns:
+        conn.close()
+
+
+atexit.register(_close_all_connections)
+
+
+def iter_rows(sql: str, params=(), path: str = None) -> Iterator[sqlite3.Row]:
+    """Yield the rows of a query in fetchmany batches instead of one big list.
+
+    The cursor is closed once the generator is exhausted or discarded.
     """
-    p = path or DB_PATH
-    os.makedirs(os.path.dirname(p), exist_ok=True)
-    return sqlite3.connect(p)
+    cur = get_connection(path).cursor()
+    try:
+        cur.execute(sql, params)
+        while True:
+            rows = cur.fetchmany(1000)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cur.close()
 
 
 def create_tables(conn: sqlite3.Connection = None):
-    """Create the events, collaterals and transactions tables if missing.
+    """Create the events, collaterals and transactions tables, indexes and
+    derived objects (search index, summary counters) if missing.
 
-    If a connection is provided, use it; otherwise open a temp connection.
+    If a connection is provided, use it; otherwise use the shared connection.
+    Databases already at SCHEMA_VERSION are skipped after a single pragma read.
     """
-    close_conn = False
     if conn is None:
         conn = get_connection()
-        close_conn = True
     cur = conn.cursor()
+    if cur.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        return
 
     cur.execute("""
     CREATE TABLE IF NOT EXISTS events (
@@ -64,11 +161,111 @@ def create_tables(conn: sqlite3.Connection = None):
     )
     """)
 
+    # databases created before `location` existed get it added once
+    try:
+        cur.execute("ALTER TABLE events ADD COLUMN location TEXT")
+    except sqlite3.OperationalError:
+        pass
+
+    # indexes for the hot lookups: latest spend per item / per-item history,
+    # collaterals by event and event name searches
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_tx_item_delta_id ON transactions(item_id, delta, id DESC)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_tx_item_id ON transactions(item_id, id DESC)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_collat_event ON collaterals(event_id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_events_name ON events(event_name COLLATE NOCASE)")
+
+    _create_events_fts(cur)
+    _create_stats(cur)
+
+    cur.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
     conn.commit()
-    if close_conn:
-        conn.close()
+
+
+def _create_events_fts(cur: sqlite3.Cursor):
+    """Create the trigram FTS5 index over events.event_name and its sync triggers.
+
+    The trigram tokenizer answers the same case-insensitive substring
+    queries as LIKE '%term%'. On SQLite builds without it the index is
+    skipped and `search_events` keeps scanning.
+    """
+    try:
+        cur.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS events_fts "
+            "USING fts5(event_name, content='events', content_rowid='id', tokenize='trigram')"
+        )
+    except sqlite3.OperationalError:
+        return
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+        INSERT INTO events_fts(rowid, event_name) VALUES (new.id, new.event_name);
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, event_name) VALUES ('delete', old.id, old.event_name);
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE OF event_name ON events BEGIN
+        INSERT INTO events_fts(events_fts, rowid, event_name) VALUES ('delete', old.id, old.event_name);
+        INSERT INTO events_fts(rowid, event_name) VALUES (new.id, new.event_name);
+    END
+    """)
+    # index rows that existed before the table was created
+    cur.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+
+
+def _create_stats(cur: sqlite3.Cursor):
+    """Create the `stats` counters table and the triggers that maintain it.
+
+    Holds the event count, item count and total quantity so `show_summary`
+    reads three rows instead of scanning both tables.
+    """
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS stats (
+        name TEXT PRIMARY KEY,
+        value INTEGER NOT NULL
+    )
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS stats_events_ai AFTER INSERT ON events BEGIN
+        UPDATE stats SET value = value + 1 WHERE name = 'events';
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS stats_events_ad AFTER DELETE ON events BEGIN
+        UPDATE stats SET value = value - 1 WHERE name = 'events';
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS stats_collaterals_ai AFTER INSERT ON collaterals BEGIN
+        UPDATE stats SET value = value + 1 WHERE name = 'items';
+        UPDATE stats SET value = value + IFNULL(new.quantity, 0) WHERE name = 'quantity';
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS stats_collaterals_ad AFTER DELETE ON collaterals BEGIN
+        UPDATE stats SET value = value - 1 WHERE name = 'items';
+        UPDATE stats SET value = value - IFNULL(old.quantity, 0) WHERE name = 'quantity';
+    END
+    """)
+    cur.execute("""
+    CREATE TRIGGER IF NOT EXISTS stats_collaterals_au AFTER UPDATE OF quantity ON collaterals BEGIN
+        UPDATE stats SET value = value + IFNULL(new.quantity, 0) - IFNULL(old.quantity, 0) WHERE name = 'quantity';
+    END
+    """)
+    # (re)seed the counters from the current data
+    cur.execute("""
+    INSERT OR REPLACE INTO stats (name, value)
+    SELECT 'events', COUNT(*) FROM events
+    UNION ALL SELECT 'items', COUNT(*) FROM collaterals
+    UNION ALL SELECT 'quantity', IFNULL(SUM(quantity), 0) FROM collaterals
+    """)
 
 
 def init_db():
     """Convenience function to initialize the database files and tables."""
+    # local import: backend.logs itself imports this module
+    from .logs import create_logs_table
     create_tables()
+    create_logs_table()
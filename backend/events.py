@@ -4,70 +4,83 @@ Functions:
 - create_event
 - update_event
 - delete_event
-- list_events
+- iter_events / list_events
 - search_events
 """
-from typing import List, Tuple, Optional
-import datetime
-from .database import get_connection
+from typing import Iterator, List, Optional
+import sqlite3
+from .database import HAS_RETURNING, get_connection, iter_rows
+from .summary import invalidate_summary
+
+_INSERT_EVENT_SQL = (
+    "INSERT INTO events (event_name, location, start_date, end_date, last_modified) "
+    "VALUES (?, ?, ?, ?, strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime'))"
+)
 
 
 def create_event(name: str, start_date: Optional[str] = None, end_date: Optional[str] = None, location: Optional[str] = None) -> int:
     """Create a new event and return its id."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        INSERT INTO events (event_name, location, start_date, end_date, last_modified)
-        VALUES (?, ?, ?, ?, ?)
-        """,
-        (name, location, start_date, end_date, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-    )
-    conn.commit()
-    last_id = cur.lastrowid
-    conn.close()
+    params = (name, location, start_date, end_date)
+    with conn:
+        if HAS_RETURNING:
+            last_id = conn.execute(_INSERT_EVENT_SQL + " RETURNING id", params).fetchone()[0]
+        else:
+            last_id = conn.execute(_INSERT_EVENT_SQL, params).lastrowid
+    invalidate_summary()
     return last_id
 
 
 def update_event(event_id: int, name: str, start_date: Optional[str], end_date: Optional[str], location: Optional[str] = None) -> None:
     """Update an event's data."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute(
-        """
-        UPDATE events
-        SET event_name=?, location=?, start_date=?, end_date=?, last_modified=?
-        WHERE id=?
-        """,
-        (name, location, start_date, end_date, datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), event_id),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute(
+            """
+            UPDATE events
+            SET event_name=?, location=?, start_date=?, end_date=?, last_modified=strftime('%Y-%m-%d %H:%M:%S', 'now', 'localtime')
+            WHERE id=?
+            """,
+            (name, location, start_date, end_date, event_id),
+        )
 
 
 def delete_event(event_id: int) -> None:
     """Delete an event by id."""
     conn = get_connection()
-    cur = conn.cursor()
-    cur.execute("DELETE FROM events WHERE id=?", (event_id,))
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.execute("DELETE FROM events WHERE id=?", (event_id,))
+    invalidate_summary()
 
 
-def list_events() -> List[Tuple[int, str]]:
-    """Return a list of (id, event_name) tuples."""
-    conn = get_connection()
-    cur = conn.cursor()
-    rows = cur.execute("SELECT id, event_name FROM events ORDER BY id DESC").fetchall()
-    conn.close()
-    return rows
+def iter_events() -> Iterator[sqlite3.Row]:
+    """Stream (id, event_name) rows as sqlite3.Row, newest first."""
+    return iter_rows("SELECT id, event_name FROM events ORDER BY id DESC")
+
+
+def list_events() -> List[sqlite3.Row]:
+    """Return a list of (id, event_name) rows as sqlite3.Row."""
+    return list(iter_events())
+
 
+def search_events(term: str) -> List[sqlite3.Row]:
+    """Search events by name (case-insensitive substring match).
 
-def search_events(term: str) -> List[Tuple[int, str]]:
-    """Search events by name (simple LIKE search)."""
+    Returns (id, event_name) rows as sqlite3.Row, newest first.
+    Terms of three or more characters are answered from the `events_fts`
+    trigram index; shorter terms (or a missing index) fall back to LIKE.
+    """
     conn = get_connection()
     cur = conn.cursor()
+    if len(term) >= 3:
+        phrase = '"' + term.replace('"', '""') + '"'
+        try:
+            return cur.execute(
+                "SELECT rowid AS id, event_name FROM events_fts WHERE events_fts MATCH ? ORDER BY rowid DESC",
+                (phrase,),
+            ).fetchall()
+        except sqlite3.OperationalError:
+            pass
     q = f"%{term}%"
     rows = cur.execute("SELECT id, event_name FROM events WHERE event_name LIKE ? ORDER BY id DESC", (q,)).fetchall()
-    conn.close()
     return rows
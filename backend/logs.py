@@ -1,32 +1,60 @@
 """Simple logging for actions into a separate logs.db file.
 
+The logs database is attached to the shared connection as schema `logs`,
+so no second connection is opened.
+
+Entries are queued by `log_action` and written in batches by a background
+thread, so callers never wait on the logs database.
+
 Functions:
 - log_action(actor, action, details)
-- view_logs(limit=100)
+- flush_logs()
+- iter_logs(limit=200, before_id=None) / view_logs(limit=200, before_id=None)
 """
-from typing import List, Tuple
-import datetime
-import os
+from typing import Iterator, List, Optional
+import atexit
+from datetime import datetime as _dt
+import queue
 import sqlite3
+import sys
+import threading
+import time
+import traceback
+from .database import get_connection, iter_rows
+
+_INSERT_LOG_SQL = "INSERT INTO logs.logs (when_ts, actor, action, details) VALUES (?, ?, ?, ?)"
+
+# background writer tuning: flush after this many rows or this many seconds
+_BATCH_MAX = 100
+_BATCH_WAIT = 0.05
+
+_log_queue = queue.Queue()
 
-LOG_DB = os.path.join('data', 'logs.db')
+# bound once: log_action is called on every UI write
+_now = _dt.now
+_TS = "%Y-%m-%d %H:%M:%S"
 
+# set once the logs table is known to exist, so later calls skip the DDL
+_logs_ready = False
 
-def _get_conn():
-    os.makedirs(os.path.dirname(LOG_DB), exist_ok=True)
-    return sqlite3.connect(LOG_DB)
 
+def create_logs_table(conn=None):
+    """Create the logs table if missing; a no-op after the first call.
 
-def _create_logs_table(conn=None):
-    close = False
+    The table is append-only, so a plain INTEGER PRIMARY KEY already gives
+    increasing ids without AUTOINCREMENT's sqlite_sequence write per insert.
+    Existing tables created with AUTOINCREMENT are left as they are.
+    """
+    global _logs_ready
+    if _logs_ready:
+        return
     if conn is None:
-        conn = _get_conn()
-        close = True
+        conn = get_connection()
     cur = conn.cursor()
     cur.execute(
         """
-        CREATE TABLE IF NOT EXISTS logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
+        CREATE TABLE IF NOT EXISTS logs.logs (
+            id INTEGER PRIMARY KEY,
             when_ts TEXT,
             actor TEXT,
             action TEXT,
@@ -35,28 +63,76 @@ def _create_logs_table(conn=None):
         """
     )
     conn.commit()
-    if close:
-        conn.close()
+    _logs_ready = True
 
 
-def log_action(actor: str, action: str, details: str = None) -> int:
-    """Insert a log entry and return the inserted id."""
-    _create_logs_table()
-    conn = _get_conn()
-    cur = conn.cursor()
-    ts = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    cur.execute("INSERT INTO logs (when_ts, actor, action, details) VALUES (?, ?, ?, ?)", (ts, actor, action, details))
-    conn.commit()
-    lid = cur.lastrowid
-    conn.close()
-    return lid
+def _write_batch(batch):
+    conn = get_connection()
+    create_logs_table(conn)
+    with conn:
+        conn.executemany(_INSERT_LOG_SQL, batch)
 
 
-def view_logs(limit: int = 200) -> List[Tuple[int, str, str, str, str]]:
-    """Return recent log rows (id, when_ts, actor, action, details)."""
-    _create_logs_table()
-    conn = _get_conn()
-    cur = conn.cursor()
-    rows = cur.execute("SELECT id, when_ts, actor, action, details FROM logs ORDER BY id DESC LIMIT ?", (limit,)).fetchall()
-    conn.close()
-    return rows
+def _log_worker():
+    while True:
+        batch = [_log_queue.get()]
+        deadline = time.monotonic() + _BATCH_WAIT
+        while len(batch) < _BATCH_MAX:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(_log_queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        try:
+            _write_batch(batch)
+        except Exception:
+            # retry once (e.g. a transient "database is locked"), then report
+            # and drop the batch; a failed write must not kill the writer
+            try:
+                time.sleep(_BATCH_WAIT)
+                _write_batch(batch)
+            except Exception:
+                print('log-writer: dropped %d log entries' % len(batch), file=sys.stderr)
+                traceback.print_exc()
+        finally:
+            for _ in batch:
+                _log_queue.task_done()
+
+
+def log_action(actor: str, action: str, details: str = None) -> None:
+    """Queue a log entry for the background writer and return immediately."""
+    _log_queue.put((_now().strftime(_TS), actor, action, details))
+
+
+def flush_logs() -> None:
+    """Block until every queued log entry has been written."""
+    _log_queue.join()
+
+
+threading.Thread(target=_log_worker, name='log-writer', daemon=True).start()
+atexit.register(flush_logs)
+
+
+def iter_logs(limit: int = 200, before_id: Optional[int] = None) -> Iterator[sqlite3.Row]:
+    """Stream recent log rows (id, when_ts, actor, action, details) as sqlite3.Row, newest first.
+
+    before_id: only return rows older than this id, to page back from the
+    last row already shown.
+    Pending queued entries are flushed first so the result is up to date.
+    """
+    flush_logs()
+    create_logs_table()
+    if before_id is None:
+        yield from iter_rows("SELECT id, when_ts, actor, action, details FROM logs.logs ORDER BY id DESC LIMIT ?", (limit,))
+    else:
+        yield from iter_rows(
+            "SELECT id, when_ts, actor, action, details FROM logs.logs WHERE id < ? ORDER BY id DESC LIMIT ?",
+            (before_id, limit),
+        )
+
+
+def view_logs(limit: int = 200, before_id: Optional[int] = None) -> List[sqlite3.Row]:
+    """Return recent log rows (id, when_ts, actor, action, details) as sqlite3.Row."""
+    return list(iter_logs(limit, before_id))
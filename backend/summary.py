@@ -1,24 +1,97 @@
 """Summary / reports helpers for the inventory system.
 
 Provides simple aggregation functions used by the UI Reports tab.
+The summary is cached until a write calls `invalidate_summary`.
+`snapshot` reads everything the main window shows in a single transaction.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
+import sqlite3
+import threading
 from .database import get_connection
 
+_summary_cache: Optional[Dict[str, Any]] = None
+# bumped on every invalidation so a summary computed concurrently with a
+# write is never stored as current
+_summary_gen = 0
+_summary_lock = threading.Lock()
 
-def show_summary() -> Dict[str, Any]:
+# same totals computed from the tables, for databases create_tables has not
+# upgraded to the `stats` counters yet
+_COUNT_SQL = """
+SELECT 'events', COUNT(*) FROM events
+UNION ALL SELECT 'items', COUNT(*) FROM collaterals
+UNION ALL SELECT 'quantity', IFNULL(SUM(quantity), 0) FROM collaterals
+"""
+
+
+def invalidate_summary() -> None:
+    """Drop the cached summary; called by every write that changes the totals."""
+    global _summary_cache, _summary_gen
+    with _summary_lock:
+        _summary_cache = None
+        _summary_gen += 1
+
+
+def cache_generation() -> int:
+    """Return the current invalidation count, for caches of other read results."""
+    return _summary_gen
+
+
+def show_summary(gen: Optional[int] = None) -> Dict[str, Any]:
     """Return a small summary dict with totals used in reports.
 
     Keys: total_events, total_items, total_quantity
+    gen: the cache_generation() taken before the caller's read transaction
+    began, so totals read from an older snapshot are never stored as current.
     """
+    global _summary_cache
+    with _summary_lock:
+        if _summary_cache is not None:
+            return dict(_summary_cache)
+        if gen is None:
+            gen = _summary_gen
     conn = get_connection()
     cur = conn.cursor()
-    total_events = cur.execute("SELECT COUNT(*) FROM events").fetchone()[0]
-    total_items = cur.execute("SELECT COUNT(*) FROM collaterals").fetchone()[0]
-    total_quantity = cur.execute("SELECT SUM(quantity) FROM collaterals").fetchone()[0] or 0
-    conn.close()
-    return {
-        'total_events': total_events,
-        'total_items': total_items,
-        'total_quantity': total_quantity,
+    # counters are kept current by triggers on events/collaterals
+    try:
+        stats = dict(cur.execute("SELECT name, value FROM stats").fetchall())
+    except sqlite3.OperationalError:
+        # pre-v4 database: no stats table yet
+        stats = dict(cur.execute(_COUNT_SQL).fetchall())
+    summary = {
+        'total_events': stats.get('events', 0),
+        'total_items': stats.get('items', 0),
+        'total_quantity': stats.get('quantity', 0),
+    }
+    with _summary_lock:
+        if gen == _summary_gen:
+            _summary_cache = summary
+    return dict(summary)
+
+
+def snapshot(parts=('events', 'items', 'summary')) -> Dict[str, Any]:
+    """Return the events, item summary and totals read in one transaction.
+
+    Keys: events (as list_events), items (as get_item_summary), summary (as show_summary)
+    parts: the subset of those keys to read; the others are left out.
+    """
+    # local imports: events and collaterals import this module
+    from .events import list_events
+    from .collaterals import get_item_summary
+    conn = get_connection()
+    # taken before BEGIN: a write committed while the transaction is open
+    # bumps the generation, so the cached readers won't store old rows
+    gen = cache_generation()
+    own_txn = not conn.in_transaction
+    if own_txn:
+        conn.execute("BEGIN")
+    readers = {
+        'events': list_events,
+        'items': lambda: get_item_summary(gen),
+        'summary': lambda: show_summary(gen),
     }
+    try:
+        return {part: readers[part]() for part in parts}
+    finally:
+        if own_txn:
+            conn.commit()
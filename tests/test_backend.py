@@ -0,0 +1,139 @@
+"""Backend tests; each test runs against fresh databases in a temp dir."""
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+import backend
+from backend import database
+from backend.summary import invalidate_summary
+
+
+class BackendTestCase(unittest.TestCase):
+    """Points the backend at empty inventory/logs files for each test."""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self._paths = database.DB_PATH, database.LOG_DB_PATH
+        database.DB_PATH = os.path.join(self.tmp, 'inventory.db')
+        database.LOG_DB_PATH = os.path.join(self.tmp, 'logs.db')
+        invalidate_summary()
+
+    def tearDown(self):
+        backend.flush_logs()
+        backend.close_connections()
+        database.DB_PATH, database.LOG_DB_PATH = self._paths
+        invalidate_summary()
+        shutil.rmtree(self.tmp, ignore_errors=True)
+
+
+class ConnectionTest(BackendTestCase):
+
+    def test_close_connections_only_closes_the_calling_thread(self):
+        backend.init_db()
+        opened, ready, closed = [], threading.Event(), threading.Event()
+
+        def worker():
+            opened.append(database.get_connection())
+            ready.set()
+            closed.wait(5)
+            # still usable after the main thread closed its own connection
+            opened.append(database.get_connection().execute("SELECT COUNT(*) FROM events").fetchone()[0])
+
+        t = threading.Thread(target=worker)
+        t.start()
+        ready.wait(5)
+        main = database.get_connection()
+        backend.close_connections()
+        closed.set()
+        t.join(5)
+        self.assertEqual(opened[1], 0)
+        self.assertIsNot(database.get_connection(), main)
+
+    def test_finished_threads_do_not_share_connections(self):
+        conns = []
+        for _ in range(2):
+            t = threading.Thread(target=lambda: conns.append(database.get_connection()))
+            t.start()
+            t.join()
+        self.assertIsNot(conns[0], conns[1])
+        # opening the second one closed the first thread's connection
+        with self.assertRaises(sqlite3.ProgrammingError):
+            conns[0].execute("SELECT 1")
+
+
+class SummaryTest(BackendTestCase):
+
+    def test_show_summary_on_pre_v4_database(self):
+        # tables as created before the stats counters existed (user_version 0)
+        conn = database.get_connection()
+        conn.executescript("""
+        CREATE TABLE events (id INTEGER PRIMARY KEY AUTOINCREMENT, event_name TEXT NOT NULL,
+                             start_date TEXT, end_date TEXT, last_modified TEXT);
+        CREATE TABLE collaterals (id INTEGER PRIMARY KEY AUTOINCREMENT, item_name TEXT NOT NULL,
+                                  quantity INTEGER DEFAULT 0, event_id INTEGER, last_modified TEXT);
+        INSERT INTO events (event_name) VALUES ('Expo');
+        INSERT INTO collaterals (item_name, quantity) VALUES ('Pens', 4), ('Mugs', 3);
+        """)
+        self.assertEqual(conn.execute("PRAGMA user_version").fetchone()[0], 0)
+        self.assertEqual(
+            backend.show_summary(),
+            {'total_events': 1, 'total_items': 2, 'total_quantity': 7},
+        )
+
+    def test_show_summary_tracks_writes(self):
+        backend.init_db()
+        e = backend.create_event('Expo')
+        i = backend.create_collateral('Pens', 10, e)
+        backend.spend_collateral(i, -3, e)
+        self.assertEqual(
+            backend.show_summary(),
+            {'total_events': 1, 'total_items': 1, 'total_quantity': 7},
+        )
+
+
+class WritesTest(BackendTestCase):
+
+    def check_writes(self):
+        backend.init_db()
+        e = backend.create_event('Expo')
+        i = backend.create_collateral('Pens', 10, e)
+        self.assertEqual(backend.list_events()[0]['id'], e)
+        self.assertEqual(backend.spend_collateral(i, -3, e), 7)
+        self.assertEqual(backend.spend_collateral(i, -30), 0)
+        with self.assertRaises(ValueError):
+            backend.spend_collateral(i + 1, 1)
+
+    def test_writes_with_returning(self):
+        if not backend.database.HAS_RETURNING:
+            self.skipTest('SQLite < 3.35')
+        self.check_writes()
+
+    def test_writes_without_returning(self):
+        with mock.patch('backend.events.HAS_RETURNING', False), \
+                mock.patch('backend.collaterals.HAS_RETURNING', False):
+            self.check_writes()
+
+
+class SearchEventsTest(BackendTestCase):
+
+    def setUp(self):
+        super().setUp()
+        backend.init_db()
+        self.expo = backend.create_event('Alpha Expo')
+        self.fair = backend.create_event('Beta Fair')
+
+    def test_short_and_long_terms_return_the_same_columns(self):
+        # 'be' is answered by LIKE, 'bet' by the trigram index (if available)
+        short, long = backend.search_events('be'), backend.search_events('bet')
+        self.assertEqual([tuple(r) for r in short], [(self.fair, 'Beta Fair')])
+        self.assertEqual([tuple(r) for r in long], [(self.fair, 'Beta Fair')])
+        self.assertEqual(short[0].keys(), long[0].keys())
+        self.assertEqual(long[0]['id'], self.fair)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,7 +12,9 @@ Run with:
 The UI uses the `backend` package for all DB operations.
 """
 from typing import Optional
-import datetime
+from concurrent.futures import ThreadPoolExecutor
+import queue
+import time
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import tkinter as tk
@@ -24,16 +26,15 @@ from backend import (
     create_event,
     update_event,
     delete_event,
-    list_events,
     create_collateral,
     update_collateral,
     delete_collateral,
     spend_collateral,
-    get_item_summary,
     get_transactions,
     log_action,
     view_logs,
-    show_summary,
+    snapshot,
+    invalidate_summary,
 )
 
 
@@ -41,17 +42,315 @@ from backend import (
 # Helper utilities
 # ----------------------------
 
-def safe_call(func, *args, success_msg: Optional[str] = None, error_title: str = 'Error'):
-    """Call func and show messagebox on error; return func result or None."""
-    try:
-        res = func(*args)
-        if success_msg:
-            messagebox.showinfo('Success', success_msg)
-        return res
-    except Exception as e:
-        messagebox.showerror(error_title, str(e))
-        return None
+class VirtualTreeview(ttk.Treeview):
+    """Treeview that only keeps the rows in view as real Tk items.
+
+    `set_data(rows)` stores the full list of value tuples; only the slice
+    under the viewport (plus OVERSCAN rows) is inserted, and that window is
+    moved as the user scrolls, so refreshing costs O(visible) tree calls
+    instead of O(rows). A refresh compares the new rows with the old ones
+    and only updates items whose values changed.
+
+    With hide_key=True the first element of each row (a database id) is
+    kept in Python but not sent to Tk, and is also the item's iid, so the
+    selection stays on its record when rows are added, removed or
+    filtered; other trees use iid=str(row index). `row(iid)` returns the
+    stored tuple and `selected_row()` the selected one, which is kept while
+    it is scrolled out of the window. <<RowSelect>> is generated whenever
+    the selected row changes, including when it leaves the data. The
+    arrow, Page, Home and End keys move the selection over all rows and
+    scroll the window after it. on_end, if given, is called whenever the
+    window reaches the last row, e.g. to fetch another page. Pass
+    yscrollcommand to the constructor and point the scrollbar's command
+    at `yview`.
+    """
+
+    OVERSCAN = 10
+    WHEEL_STEP = 3
+    # zebra-stripe tags indexed by row & 1; shared tuples, nothing built per row
+    ROW_TAGS = (('odd',), ('even',))
+    # handled here instead of by Tk, which can only reach materialised rows
+    NAV_KEYS = ('Up', 'Down', 'Prior', 'Next', 'Home', 'End')
+
+    def __init__(self, master=None, yscrollcommand=None, hide_key=False, on_end=None, **kw):
+        # the handlers act on one row at a time
+        kw.setdefault('selectmode', 'browse')
+        super().__init__(master, **kw)
+        self._on_end = on_end
+        self._keyed = hide_key
+        self._skip = 1 if hide_key else 0
+        self._rows = []
+        # iid -> row index, for keyed trees
+        self._index = {}
+        self._first = 0
+        # iid -> stripe bit of the items in Tk, in display order
+        self._shown = {}
+        self._selected = None
+        self._page = int(self.cget('height'))
+        self._yscroll = yscrollcommand
+        self.tag_configure('odd', background='#f7f7f7')
+        self.tag_configure('even', background='#ffffff')
+        self.bind('<Configure>', self._on_configure, add='+')
+        self.bind('<<TreeviewSelect>>', self._on_select, add='+')
+        for seq in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.bind(seq, self._on_wheel, add='+')
+        for key in self.NAV_KEYS:
+            self.bind(f'<{key}>', self._on_nav_key, add='+')
+
+    def set_data(self, rows):
+        """Replace the full row list, touching only visible rows that changed.
+
+        The selection follows its row; it is cleared when the row is gone.
+        """
+        old, old_index = self._rows, self._index
+        self._rows = rows = list(rows)
+        if self._keyed:
+            self._index = {str(r[0]): i for i, r in enumerate(rows)}
+        call, w = self.tk.call, self._w
+        skip = self._skip
+        for iid in self._shown:
+            i = self._pos(iid)
+            if i is not None and rows[i] != old[old_index[iid] if self._keyed else i]:
+                call(w, 'item', iid, '-values', rows[i][skip:])
+        if self._selected is not None and self._pos(self._selected) is None:
+            self._selected = None
+            self.event_generate('<<RowSelect>>')
+        # _render drops rows no longer in the window and inserts new ones
+        self._scroll_to(self._first)
+
+    def row(self, iid):
+        """Return the full row tuple (including any hidden key) for an item."""
+        return self._rows[self._index[iid] if self._keyed else int(iid)]
+
+    def selected_row(self):
+        """Return the selected row tuple, or None if nothing is selected."""
+        return None if self._selected is None else self.row(self._selected)
+
+    def yview(self, *args):
+        """Scroll by rows of data; same protocol as Treeview.yview."""
+        n = len(self._rows)
+        if not args:
+            if not n:
+                return (0.0, 1.0)
+            return (self._first / n, min(1.0, (self._first + self._page) / n))
+        if args[0] == 'moveto':
+            self._scroll_to(int(float(args[1]) * n))
+        elif args[0] == 'scroll':
+            step = int(args[1]) * (self._page if args[2] == 'pages' else 1)
+            self._scroll_to(self._first + step)
+
+    def _scroll_to(self, first):
+        self._first = max(0, min(first, len(self._rows) - self._page))
+        self._render()
+
+    def _iid(self, i):
+        return str(self._rows[i][0]) if self._keyed else str(i)
+
+    def _pos(self, iid):
+        # index of the row shown as iid, or None if it left the data
+        if self._keyed:
+            return self._index.get(iid)
+        i = int(iid)
+        return i if i < len(self._rows) else None
+
+    def _render(self):
+        rows = self._rows
+        first = self._first
+        want = range(first, min(len(rows), first + self._page + self.OVERSCAN))
+        iids = [self._iid(i) for i in want]
+        wanted = set(iids)
+        shown = self._shown
+        keep = [iid for iid in shown if iid in wanted]
+        kept = set(keep)
+        # items kept from the last window must still be in the same order,
+        # otherwise (rows were reordered) the window is rebuilt
+        if keep != [iid for iid in iids if iid in kept]:
+            kept = set()
+        stale = [iid for iid in shown if iid not in kept]
+        if stale:
+            self.delete(*stale)
+        # raw Tcl calls: Treeview.insert/item re-format their options in
+        # Python on every call, which dominates a fill of a few dozen rows
+        call, w = self.tk.call, self._w
+        skip = self._skip
+        tags = self.ROW_TAGS
+        bits = {}
+        for pos, (i, iid) in enumerate(zip(want, iids)):
+            bit = bits[iid] = i & 1
+            if iid not in kept:
+                # everything above pos is already in place
+                call(w, 'insert', '', pos, '-id', iid, '-values', rows[i][skip:], '-tags', tags[bit])
+            elif shown[iid] != bit:
+                # rows added or removed above moved it to the other stripe
+                call(w, 'item', iid, '-tags', tags[bit])
+        self._shown = bits
+        if self._selected in wanted and self._selected not in kept:
+            # the selected row was scrolled back in or rebuilt
+            self.selection_set(self._selected)
+        # keep Tk's own view pinned to the top of the materialised window
+        ttk.Treeview.yview(self, 'moveto', 0)
+        if self._yscroll:
+            self._yscroll(*self.yview())
+        if self._on_end and rows and want.stop >= len(rows):
+            self._on_end()
+
+    def _on_select(self, _ev=None):
+        sel = self.selection()
+        key = sel[0] if sel else None
+        # Tk also reports re-selecting the same row, and an empty selection
+        # when the selected row is merely scrolled out of the window
+        if key == self._selected or (key is None and self._selected not in self._shown):
+            return
+        self._selected = key
+        self.event_generate('<<RowSelect>>')
+
+    def _on_configure(self, event):
+        rowheight = int(ttk.Style().lookup('Treeview', 'rowheight') or 20)
+        # one row's worth of height is taken by the headings
+        page = max(1, event.height // rowheight - 1)
+        if page != self._page:
+            self._page = page
+            self._scroll_to(self._first)
+
+    def _on_wheel(self, event):
+        up = event.num == 4 or event.delta > 0
+        self._scroll_to(self._first + (-self.WHEEL_STEP if up else self.WHEEL_STEP))
+        return 'break'
+
+    def _on_nav_key(self, event):
+        n = len(self._rows)
+        if not n:
+            return 'break'
+        key = event.keysym
+        cur = None if self._selected is None else self._pos(self._selected)
+        if key == 'Home':
+            i = 0
+        elif key == 'End':
+            i = n - 1
+        elif cur is None:
+            # nothing selected yet: start at the top of the window
+            i = self._first
+        else:
+            step = self._page if key in ('Prior', 'Next') else 1
+            i = cur - step if key in ('Up', 'Prior') else cur + step
+        i = max(0, min(i, n - 1))
+        # scroll just far enough to bring the row into view
+        if i < self._first:
+            self._scroll_to(i)
+        elif i >= self._first + self._page:
+            self._scroll_to(i - self._page + 1)
+        iid = self._iid(i)
+        self.selection_set(iid)
+        self.focus(iid)
+        # skip Tk's class bindings, whose `see` would scroll its own view
+        return 'break'
+
+
+# (heading, width, anchor) for each tree column; anchor None keeps Tk's
+# defaults (centred heading, left-aligned cells). Row ids are hidden keys
+# of the events and items rows (see VirtualTreeview), not columns.
+EVENT_COLS = (
+    ('Event Name', 300, W),
+    ('Location', 120, W),
+    ('Start Date', 120, CENTER),
+    ('End Date', 120, CENTER),
+    ('Last Modified', 120, CENTER),
+)
+ITEM_COLS = (
+    ('Item Name', 340, W),
+    ('Quantity', 100, CENTER),
+    ('Last Event Used', 100, CENTER),
+    ('Last Modified', 100, CENTER),
+)
+LOG_COLS = tuple((name, 120, None) for name in ('ID', 'When', 'Actor', 'Action', 'Details'))
+
+
+def scrolled_tree(master, cols, **kw) -> VirtualTreeview:
+    """Pack a VirtualTreeview with the given column spec and a scrollbar into master."""
+    frame = ttk.Frame(master)
+    frame.pack(fill=BOTH, expand=True, padx=12, pady=6)
+    scrollbar = ttk.Scrollbar(frame, orient=VERTICAL)
+    tree = VirtualTreeview(frame, columns=[c[0] for c in cols], yscrollcommand=scrollbar.set, **kw)
+    for name, width, anchor in cols:
+        if anchor is None:
+            tree.heading(name, text=name)
+            tree.column(name, width=width)
+        else:
+            tree.heading(name, text=name, anchor=anchor)
+            tree.column(name, width=width, anchor=anchor)
+    scrollbar.configure(command=tree.yview)
+    scrollbar.pack(side=RIGHT, fill=Y)
+    tree.pack(side=LEFT, fill=BOTH, expand=True)
+    return tree
+
+
+class MultiFieldDialog(ttk.Toplevel):
+    """Reusable modal form with one labelled entry per field and one button.
+
+    fields: sequence of (label, type) with type str or int. The window is
+    built once and hidden between uses; each show() resets the entries.
+    """
+
+    def __init__(self, master, fields):
+        super().__init__(master)
+        self.withdraw()
+        self.transient(master)
+        self.protocol('WM_DELETE_WINDOW', self._cancel)
+        self._fields = fields
+        self._vars = []
+        self._validate = None
+        self._result = None
+        self._done = ttk.BooleanVar(self, value=False)
+        for row, (label, kind) in enumerate(fields):
+            ttk.Label(self, text=f'{label}:').grid(row=row, column=0, padx=8, pady=6)
+            var = ttk.StringVar()
+            ttk.Entry(self, textvariable=var, width=40 if kind is str else 20).grid(row=row, column=1, padx=8, pady=6)
+            self._vars.append(var)
+        self._button = ttk.Button(self, bootstyle='success', command=self._submit)
+        self._button.grid(row=len(fields), column=0, columnspan=2, pady=8)
+
+    def show(self, title, values=None, button='Save', validate=None):
+        """Run the form modally; return {label: value}, or None if closed.
+
+        values: initial entry values in field order (blank if omitted).
+        validate: optional callable taking the result dict and returning an
+        error message (the dialog stays open) or None.
+        """
+        self.title(title)
+        self._button.configure(text=button)
+        self._validate = validate
+        self._result = None
+        for var, value in zip(self._vars, values or [''] * len(self._vars)):
+            var.set('' if value is None else str(value))
+        self.deiconify()
+        self.grab_set()
+        self.wait_variable(self._done)
+        self.grab_release()
+        self.withdraw()
+        return self._result
+
+    def _submit(self):
+        result = {}
+        for (label, kind), var in zip(self._fields, self._vars):
+            text = var.get().strip()
+            if kind is int:
+                try:
+                    result[label] = int(text)
+                except ValueError:
+                    messagebox.showwarning('Invalid', f'{label} must be an integer.', parent=self)
+                    return
+            else:
+                result[label] = text
+        error = self._validate(result) if self._validate else None
+        if error:
+            messagebox.showwarning('Invalid', error, parent=self)
+            return
+        self._result = result
+        self._done.set(True)
 
+    def _cancel(self):
+        self._result = None
+        self._done.set(True)
 
 # ----------------------------
 # Main Application
@@ -59,6 +358,13 @@ def safe_call(func, *args, success_msg: Optional[str] = None, error_title: str =
 class InventoryApp(ttk.Window):
     """Main application window using ttkbootstrap.Window (theme 'cosmo')."""
 
+    # delay before a selection loads its items / transactions
+    SELECT_DEBOUNCE_MS = 150
+    # log rows fetched per page; older pages load as the logs tree is scrolled
+    LOGS_PAGE = 30
+    # how often the Tk thread picks up finished DB worker calls
+    RESULT_POLL_MS = 20
+
     def __init__(self):
         super().__init__(themename='cosmo')
         self.title('TDD Inventory System')
@@ -71,10 +377,29 @@ class InventoryApp(ttk.Window):
             # init_db uses backend.database.create_tables which already handles dirs.
             pass
 
-        # mapping event id <-> name for quick lookup
+        # mapping event id <-> name for quick lookup; rebuilt only by
+        # load_events, i.e. after event changes
         self.event_id_to_name = {}
         self.event_name_to_id = {}
+        self.event_names = []
         self.selected_event_id: Optional[int] = None
+        self._select_after_id = None
+        self._event_select_after_id = None
+
+        # views waiting for a coalesced refresh (see request_refresh)
+        self._pending_refresh = set()
+        self._refresh_scheduled = False
+        self._pending_status = None
+
+        # all reads run on one worker thread so queries never block Tk
+        self._db_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='db')
+        # (future, on_done) of finished calls; the worker never touches Tk,
+        # _poll_results drains this on the Tk thread
+        self._results = queue.Queue()
+        self._poll_after_id = self.after(self.RESULT_POLL_MS, self._poll_results)
+
+        # hidden form dialogs kept for reuse, keyed by field layout
+        self._forms = {}
 
         # Top label
         ttk.Label(self, text='TDD Collateral Inventory System', font=('Segoe UI', 18, 'bold')).pack(pady=10)
@@ -90,6 +415,13 @@ class InventoryApp(ttk.Window):
         self.tabs.add(self.reports_tab, text='Reports')
         self.tabs.add(self.logs_tab, text='Logs')
         self.tabs.pack(fill=BOTH, expand=True, padx=10, pady=8)
+        # the Logs tab is only queried once it is first shown
+        self._logs_loaded = False
+        # rows shown in the logs tree when it holds logs (None for transactions)
+        self._log_rows = None
+        self._logs_more = False
+        self._logs_fetching = False
+        self.tabs.bind('<<NotebookTabChanged>>', self._on_tab_changed)
 
         # Build each tab
         self.build_events_tab()
@@ -98,27 +430,138 @@ class InventoryApp(ttk.Window):
         self.build_logs_tab()
 
         # status bar
+        self._status_sec = 0
+        self._status_ts = ''
         self.status_var = ttk.StringVar(value='Ready')
         status_frame = ttk.Frame(self)
         status_frame.pack(fill=X, side=BOTTOM)
         ttk.Label(status_frame, textvariable=self.status_var, font=('Segoe UI', 9)).pack(side=LEFT, padx=6)
+        # quiet mode reports successful event changes in the status bar only
+        self.quiet_var = ttk.BooleanVar(value=False)
+        ttk.Checkbutton(status_frame, text='Quiet', variable=self.quiet_var, bootstyle='round-toggle').pack(side=RIGHT, padx=6)
         self.update_status('Ready')
 
-        # initial load
-        self.load_events()
-        self.load_items()
-        self.update_reports()
-        self.load_logs()
+        # initial load (logs wait for their tab, see _on_tab_changed)
+        self.request_refresh('events', 'items', 'reports')
 
     # ----------------------------
     # Status helpers
     # ----------------------------
     def update_status(self, message: Optional[str] = None):
         """Update bottom status bar with timestamp."""
-        ts = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        # the formatted time is reused for every update within the same second
+        now = int(time.time())
+        if now != self._status_sec:
+            self._status_sec = now
+            self._status_ts = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(now))
+        ts = self._status_ts
         msg = f'Last updated: {ts}' if message is None else f'{message} — {ts}'
         self.status_var.set(msg)
 
+    def destroy(self):
+        self.after_cancel(self._poll_after_id)
+        self._db_pool.shutdown(wait=False)
+        super().destroy()
+
+    def _form(self, *fields):
+        """Return the dialog for this (label, type) layout, built on first use."""
+        dlg = self._forms.get(fields)
+        if dlg is None:
+            dlg = self._forms[fields] = MultiFieldDialog(self, fields)
+        return dlg
+
+    # ----------------------------
+    # Background DB access
+    # ----------------------------
+    def _async(self, fn, *args, on_done=None):
+        """Run fn(*args) on the DB worker; on_done(result) runs on the Tk thread.
+
+        The single worker runs calls in submission order, so a refresh
+        requested after a write always sees that write.
+        """
+        fut = self._db_pool.submit(fn, *args)
+        if on_done is None:
+            return
+        # runs on the worker thread, so it only hands the future over
+        fut.add_done_callback(lambda f: self._results.put((f, on_done)))
+
+    def _poll_results(self):
+        while True:
+            try:
+                fut, on_done = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._deliver(fut, on_done)
+        self._poll_after_id = self.after(self.RESULT_POLL_MS, self._poll_results)
+
+    def _deliver(self, fut, on_done):
+        try:
+            res = fut.result()
+        except Exception as e:
+            messagebox.showerror('Error', str(e))
+            return
+        on_done(res)
+
+    # ----------------------------
+    # Refresh coalescing
+    # ----------------------------
+    def request_refresh(self, *views: str, status: Optional[str] = None):
+        """Schedule views ('events', 'items', 'reports', 'logs') to reload once.
+
+        Requests made before Tk next goes idle are merged, so a handler that
+        asks for several views, or several handlers in a row, cause at most
+        one reload per view. status, if given, is shown in the status bar
+        once the reload has been drawn.
+        """
+        self._pending_refresh.update(views)
+        if status:
+            self._pending_status = status
+        if not self._refresh_scheduled:
+            self._refresh_scheduled = True
+            self.after_idle(self._flush_refresh)
+
+    def reload(self, *views: str):
+        """Refresh button: re-read views from the database, bypassing the caches.
+
+        The summary caches only know about writes made by this process, so
+        changes from another process are picked up here.
+        """
+        invalidate_summary()
+        self.request_refresh(*views)
+
+    # view -> the snapshot() part it is drawn from
+    _SNAPSHOT_PARTS = (('events', 'events'), ('items', 'items'), ('reports', 'summary'))
+
+    def _flush_refresh(self):
+        pending, self._pending_refresh = self._pending_refresh, set()
+        status, self._pending_status = self._pending_status, None
+        self._refresh_scheduled = False
+        # events, items and reports are all fed from one backend snapshot;
+        # events are only re-read when they were asked for (i.e. after event
+        # changes), otherwise load_items keeps using the cached name maps
+        parts = [part for view, part in self._SNAPSHOT_PARTS if view in pending]
+        if parts:
+            self._async(snapshot, parts, on_done=lambda snap: self._apply_snapshot(pending, snap, status))
+        elif status:
+            self.update_status(status)
+        if 'logs' in pending:
+            self.load_logs()
+
+    def _apply_snapshot(self, views, snap, status=None):
+        # events load first: load_items relies on the event name maps
+        if 'events' in views:
+            self.load_events(snap['events'])
+        if 'items' in views:
+            self.load_items(snap['items'])
+        if 'reports' in views:
+            self.update_reports(snap['summary'])
+        if status:
+            self.update_status(status)
+
+    def _on_tab_changed(self, _ev=None):
+        if not self._logs_loaded and self.tabs.select() == str(self.logs_tab):
+            self.request_refresh('logs')
+
     # ----------------------------
     # Events tab
     # ----------------------------
@@ -132,49 +575,46 @@ class InventoryApp(ttk.Window):
         ttk.Button(btns, text='➕ Add', bootstyle='success', command=self.add_event).pack(side=LEFT, padx=4)
         ttk.Button(btns, text='✎ Edit', bootstyle='warning', command=self.edit_event).pack(side=LEFT, padx=4)
         ttk.Button(btns, text='🗑 Delete', bootstyle='danger', command=self.delete_event).pack(side=LEFT, padx=4)
-        ttk.Button(btns, text='↻ Refresh', bootstyle='info', command=self.load_events).pack(side=LEFT, padx=4)
-
-        cols = ('ID', 'Event Name', 'Location', 'Start Date', 'End Date', 'Last Modified')
-        display_cols = [c for c in cols if c != 'ID']
-        self.event_tree = ttk.Treeview(self.events_tab, columns=cols, displaycolumns=display_cols, show='headings', height=14)
-        for c in cols:
-            anchor = CENTER if c != 'Event Name' and c != 'Location' else W
-            width = 300 if c == 'Event Name' else 120
-            if c == 'ID':
-                self.event_tree.heading(c, text=c)
-                self.event_tree.column(c, width=0, stretch=False)
-            else:
-                self.event_tree.heading(c, text=c, anchor=anchor)
-                self.event_tree.column(c, width=width, anchor=anchor)
-        self.event_tree.pack(fill=BOTH, expand=True, padx=12, pady=6)
-        self.event_tree.bind('<<TreeviewSelect>>', self.on_event_selected)
-
-    def load_events(self):
-        """Load events into the events tree and refresh mappings."""
-        for r in self.event_tree.get_children():
-            self.event_tree.delete(r)
-        rows = list_events()
+        ttk.Button(btns, text='↻ Refresh', bootstyle='info', command=lambda: self.reload('events')).pack(side=LEFT, padx=4)
+
+        self.event_tree = scrolled_tree(self.events_tab, EVENT_COLS, hide_key=True, show='headings', height=14)
+        self.event_tree.bind('<<RowSelect>>', self.on_event_selected)
+
+    def load_events(self, rows):
+        """Load events into the events tree and refresh mappings.
+
+        rows: list_events() result, read on the DB worker by snapshot().
+        """
         self.event_id_to_name = {r[0]: r[1] for r in rows}
         self.event_name_to_id = {r[1]: r[0] for r in rows}
-        for i, r in enumerate(rows):
-            tag = 'odd' if (i % 2) == 0 else 'even'
-            self.event_tree.insert('', END, values=(r[0], r[1], '-', '-', '-', '-'), tags=(tag,))
+        names = [r[1] for r in rows]
+        # the collaterals filter only gets new values when the names changed,
+        # which skips pushing an identical list through Tcl on every refresh
+        if names != self.event_names:
+            self.event_names = names
+            self.event_filter['values'] = names
+        self.event_tree.set_data([(r[0], r[1], '-', '-', '-', '-') for r in rows])
         self.update_status('Events refreshed')
 
     def on_event_selected(self, _ev=None):
-        sel = self.event_tree.selection()
-        if not sel:
+        vals = self.event_tree.selected_row()
+        # the tab switch and item reload wait until the selection settles,
+        # so arrowing through events does not reload items for every row
+        if self._event_select_after_id:
+            self.after_cancel(self._event_select_after_id)
+            self._event_select_after_id = None
+        if vals is None:
             self.selected_event_id = None
             return
-        vals = self.event_tree.item(sel[0])['values']
-        try:
-            self.selected_event_id = int(vals[0])
-        except Exception:
-            self.selected_event_id = None
+        self.selected_event_id = vals[0]
+        self._event_select_after_id = self.after(self.SELECT_DEBOUNCE_MS, self._show_event_items)
+
+    def _show_event_items(self):
+        self._event_select_after_id = None
         # also switch to Collaterals tab and filter
         try:
             self.tabs.select(self.collateral_tab)
-            self.load_items()
+            self.request_refresh('items')
         except Exception:
             pass
 
@@ -183,72 +623,49 @@ class InventoryApp(ttk.Window):
         if not data:
             return
         name, location, start, end = data
-        eid = safe_call(create_event, name, start, end, location, success_msg='Event created')
-        if eid:
-            log_action('ui', 'create_event', f'{name}')
-            self.load_events()
-            self.update_reports()
+        self._async(create_event, name, start, end, location, on_done=lambda _id: self._event_written(
+            'create_event', f'{name}', 'Event created', 'events', 'reports'))
 
     def edit_event(self):
-        sel = self.event_tree.selection()
-        if not sel:
+        vals = self.event_tree.selected_row()
+        if vals is None:
             messagebox.showwarning('No selection', 'Please select an event to edit.')
             return
-        vals = self.event_tree.item(sel[0])['values']
         event_id = vals[0]
         # prompt with existing name only for simplicity
-        name = simpledialog.askstring('Edit Event', 'Event Name:', initialvalue=vals[1], parent=self)
+        data = self._form(('Event Name', str)).show('Edit Event', (vals[1],))
+        name = data and data['Event Name']
         if not name:
             return
-        safe_call(update_event, event_id, name, None, None, None, success_msg='Event updated')
-        log_action('ui', 'update_event', f'{event_id}:{name}')
-        self.load_events()
+        self._async(update_event, event_id, name, None, None, None, on_done=lambda _: self._event_written(
+            'update_event', f'{event_id}:{name}', 'Event updated', 'events'))
 
     def delete_event(self):
-        sel = self.event_tree.selection()
-        if not sel:
+        vals = self.event_tree.selected_row()
+        if vals is None:
             messagebox.showwarning('No selection', 'Please select an event to delete.')
             return
-        vals = self.event_tree.item(sel[0])['values']
         if not messagebox.askyesno('Confirm', f'Delete event {vals[1]}?'):
             return
-        safe_call(delete_event, vals[0], success_msg='Event deleted')
-        log_action('ui', 'delete_event', f'{vals[0]}:{vals[1]}')
-        self.load_events()
-        self.load_items()
-        self.update_reports()
+        self._async(delete_event, vals[0], on_done=lambda _: self._event_written(
+            'delete_event', f'{vals[0]}:{vals[1]}', 'Event deleted', 'events', 'items', 'reports'))
+
+    def _event_written(self, action, details, status, *views):
+        # completion of an event write that ran on the DB worker; failures
+        # were already reported by _deliver and never get here
+        if not self.quiet_var.get():
+            messagebox.showinfo('Success', status)
+        log_action('ui', action, details)
+        self.request_refresh(*views, status=status)
 
     def open_event_dialog(self):
-        """Modal dialog to add an event (name, optional location, start/end simple inputs)."""
-        dlg = ttk.Toplevel(self)
-        dlg.title('Add Event')
-        dlg.transient(self)
-        dlg.grab_set()
-        ttk.Label(dlg, text='Event Name:').grid(row=0, column=0, padx=8, pady=6)
-        name_var = ttk.StringVar()
-        ttk.Entry(dlg, textvariable=name_var, width=40).grid(row=0, column=1, padx=8, pady=6)
-        ttk.Label(dlg, text='Location:').grid(row=1, column=0, padx=8, pady=6)
-        loc_var = ttk.StringVar()
-        ttk.Entry(dlg, textvariable=loc_var, width=40).grid(row=1, column=1, padx=8, pady=6)
-
-        res = {'ok': False}
-
-        def submit():
-            n = name_var.get().strip()
-            if not n:
-                messagebox.showwarning('Invalid', 'Event name required.', parent=dlg)
-                return
-            res['name'] = n
-            res['loc'] = loc_var.get().strip() or None
-            res['ok'] = True
-            dlg.destroy()
-
-        ttk.Button(dlg, text='Save', bootstyle='success', command=submit).grid(row=2, column=0, columnspan=2, pady=8)
-        name_var.set('')
-        self.wait_window(dlg)
-        if not res.get('ok'):
+        """Modal dialog to add an event (name, optional location)."""
+        data = self._form(('Event Name', str), ('Location', str)).show(
+            'Add Event', validate=lambda d: None if d['Event Name'] else 'Event name required.',
+        )
+        if not data:
             return None
-        return (res['name'], res['loc'], None, None)
+        return (data['Event Name'], data['Location'] or None, None, None)
 
     # ----------------------------
     # Collaterals tab
@@ -262,7 +679,7 @@ class InventoryApp(ttk.Window):
         self.event_filter_var = ttk.StringVar()
         self.event_filter = ttk.Combobox(header, textvariable=self.event_filter_var, state='readonly', width=40)
         self.event_filter.pack(side=LEFT, padx=8)
-        self.event_filter.bind('<<ComboboxSelected>>', lambda e: self.load_items())
+        self.event_filter.bind('<<ComboboxSelected>>', lambda e: self.request_refresh('items'))
 
         btns = ttk.Frame(header)
         btns.pack(side=RIGHT)
@@ -271,31 +688,16 @@ class InventoryApp(ttk.Window):
         ttk.Button(btns, text='🗑 Delete', bootstyle='danger', command=self.delete_item).pack(side=LEFT, padx=4)
         ttk.Button(btns, text='+ Qty', bootstyle='info', command=self.increase_qty).pack(side=LEFT, padx=4)
         ttk.Button(btns, text='- Qty', bootstyle='info', command=self.decrease_qty).pack(side=LEFT, padx=4)
-        ttk.Button(btns, text='↻ Refresh', bootstyle='secondary', command=self.load_items).pack(side=LEFT, padx=4)
-
-        cols = ('ID', 'Item Name', 'Quantity', 'Last Event Used', 'Last Modified')
-        display_cols = [c for c in cols if c != 'ID']
-        self.item_tree = ttk.Treeview(self.collateral_tab, columns=cols, displaycolumns=display_cols, show='headings', height=14)
-        for c in cols:
-            anchor = CENTER if c != 'Item Name' else W
-            width = 340 if c == 'Item Name' else 100
-            if c == 'ID':
-                self.item_tree.heading(c, text=c)
-                self.item_tree.column(c, width=0, stretch=False)
-            else:
-                self.item_tree.heading(c, text=c, anchor=anchor)
-                self.item_tree.column(c, width=width, anchor=anchor)
-        self.item_tree.pack(fill=BOTH, expand=True, padx=12, pady=6)
-        self.item_tree.bind('<<TreeviewSelect>>', self.on_item_select)
-
-    def load_items(self):
-        """Load collaterals, optionally filtered by selected event in event_filter."""
-        for r in self.item_tree.get_children():
-            self.item_tree.delete(r)
-        # populate event filter
-        events = list_events()
-        names = [e[1] for e in events]
-        self.event_filter['values'] = names
+        ttk.Button(btns, text='↻ Refresh', bootstyle='secondary', command=lambda: self.reload('items')).pack(side=LEFT, padx=4)
+
+        self.item_tree = scrolled_tree(self.collateral_tab, ITEM_COLS, hide_key=True, show='headings', height=14)
+        self.item_tree.bind('<<RowSelect>>', self.on_item_select)
+
+    def load_items(self, rows):
+        """Load collaterals, optionally filtered by selected event in event_filter.
+
+        rows: get_item_summary() result, read on the DB worker by snapshot().
+        """
         # if an event is selected in Events tab, select it here
         if self.selected_event_id:
             name = self.event_id_to_name.get(self.selected_event_id)
@@ -305,141 +707,98 @@ class InventoryApp(ttk.Window):
                 except Exception:
                     pass
 
-        rows = get_item_summary()
         # if filter selected, map to id
         f = self.event_filter.get()
         fid = self.event_name_to_id.get(f) if f else None
-        for i, r in enumerate(rows):
-            # r: id, name, qty, last_event, last_time
-            if fid and r[3] and int(r[3]) != int(fid):
-                continue
-            last_event_name = self.event_id_to_name.get(r[3], '-') if r[3] else '-'
-            tag = 'odd' if (i % 2) == 0 else 'even'
-            self.item_tree.insert('', END, values=(r[0], r[1], r[2], last_event_name, r[4] or '-'), tags=(tag,))
+        # ids come back from SQLite as ints, so no int() conversion is needed
+        id_to_name = self.event_id_to_name
+        data = [
+            (item_id, name, qty, id_to_name.get(last_event, '-') if last_event else '-', last_time or '-')
+            for item_id, name, qty, last_event, last_time in rows
+            if not (fid and last_event and last_event != fid)
+        ]
+        self.item_tree.set_data(data)
         self.update_status('Collaterals refreshed')
 
     def on_item_select(self, _ev=None):
-        sel = self.item_tree.selection()
-        if not sel:
+        vals = self.item_tree.selected_row()
+        # debounced, so arrowing through the list queries only the final row
+        if self._select_after_id:
+            self.after_cancel(self._select_after_id)
+            self._select_after_id = None
+        # <<RowSelect>> only fires when the selected item changes, so there
+        # is no re-selection of the same item to skip here
+        if vals is None:
+            # the selected item was deleted or filtered out
             return
-        vals = self.item_tree.item(sel[0])['values']
-        # load transactions to logs area for quick view
-        try:
-            txs = get_transactions(vals[0])
-            # update logs view with transactions (not persisted logs)
-            self._populate_logs(txs_only=txs)
-        except Exception:
-            pass
+        self._select_after_id = self.after(self.SELECT_DEBOUNCE_MS, self._load_item_transactions, vals[0])
+
+    def _load_item_transactions(self, item_id):
+        self._select_after_id = None
+        # load transactions to logs area for quick view (not persisted logs)
+        self._async(get_transactions, item_id, on_done=lambda txs: self._populate_logs(txs_only=txs))
 
     def add_item(self):
-        dlg = ttk.Toplevel(self)
-        dlg.title('Add Item')
-        dlg.transient(self)
-        dlg.grab_set()
-        ttk.Label(dlg, text='Item Name:').grid(row=0, column=0, padx=8, pady=6)
-        name_var = ttk.StringVar()
-        ttk.Entry(dlg, textvariable=name_var, width=40).grid(row=0, column=1, padx=8, pady=6)
-        ttk.Label(dlg, text='Quantity:').grid(row=1, column=0, padx=8, pady=6)
-        qty_var = ttk.IntVar(value=1)
-        ttk.Entry(dlg, textvariable=qty_var, width=20).grid(row=1, column=1, padx=8, pady=6)
-
-        def submit():
-            n = name_var.get().strip()
-            try:
-                q = int(qty_var.get())
-            except Exception:
-                messagebox.showwarning('Invalid', 'Quantity must be an integer.', parent=dlg)
-                return
-            if not n:
-                messagebox.showwarning('Invalid', 'Name required.', parent=dlg)
-                return
-            eid = create_collateral(n, q, self.selected_event_id)
-            log_action('ui', 'create_collateral', f'{n}:{q}')
-            dlg.destroy()
-            self.load_items()
-            self.update_reports()
-
-        ttk.Button(dlg, text='Add', bootstyle='success', command=submit).grid(row=2, column=0, columnspan=2, pady=8)
-        name_var.set('')
-        self.wait_window(dlg)
+        data = self._form(('Item Name', str), ('Quantity', int)).show(
+            'Add Item', ('', 1), button='Add',
+            validate=lambda d: None if d['Item Name'] else 'Name required.',
+        )
+        if not data:
+            return
+        n, q = data['Item Name'], data['Quantity']
+        self._async(create_collateral, n, q, self.selected_event_id, on_done=lambda _id: self._item_written(
+            'create_collateral', f'{n}:{q}', f'Item {n} added'))
 
     def edit_item(self):
-        sel = self.item_tree.selection()
-        if not sel:
+        vals = self.item_tree.selected_row()
+        if vals is None:
             messagebox.showwarning('No selection', 'Please select an item to edit.')
             return
-        vals = self.item_tree.item(sel[0])['values']
         item_id = vals[0]
-        dlg = ttk.Toplevel(self)
-        dlg.title('Edit Item')
-        dlg.transient(self)
-        dlg.grab_set()
-        ttk.Label(dlg, text='Item Name:').grid(row=0, column=0, padx=8, pady=6)
-        name_var = ttk.StringVar(value=vals[1])
-        ttk.Entry(dlg, textvariable=name_var, width=40).grid(row=0, column=1, padx=8, pady=6)
-        ttk.Label(dlg, text='Quantity:').grid(row=1, column=0, padx=8, pady=6)
-        qty_var = ttk.IntVar(value=vals[2])
-        ttk.Entry(dlg, textvariable=qty_var, width=20).grid(row=1, column=1, padx=8, pady=6)
-
-        def submit():
-            n = name_var.get().strip()
-            try:
-                q = int(qty_var.get())
-            except Exception:
-                messagebox.showwarning('Invalid', 'Quantity must be an integer.', parent=dlg)
-                return
-            update_collateral(item_id, n, q, self.selected_event_id)
-            log_action('ui', 'update_collateral', f'{item_id}:{n}:{q}')
-            dlg.destroy()
-            self.load_items()
-            self.update_reports()
-
-        ttk.Button(dlg, text='Save', bootstyle='success', command=submit).grid(row=2, column=0, columnspan=2, pady=8)
-        self.wait_window(dlg)
+        data = self._form(('Item Name', str), ('Quantity', int)).show('Edit Item', (vals[1], vals[2]))
+        if not data:
+            return
+        n, q = data['Item Name'], data['Quantity']
+        self._async(update_collateral, item_id, n, q, self.selected_event_id, on_done=lambda _: self._item_written(
+            'update_collateral', f'{item_id}:{n}:{q}', f'Item {n} updated'))
 
     def delete_item(self):
-        sel = self.item_tree.selection()
-        if not sel:
+        vals = self.item_tree.selected_row()
+        if vals is None:
             messagebox.showwarning('No selection', 'Please select an item to delete.')
             return
-        vals = self.item_tree.item(sel[0])['values']
         if not messagebox.askyesno('Confirm', f'Delete item {vals[1]}?'):
             return
-        delete_collateral(vals[0])
-        log_action('ui', 'delete_collateral', f'{vals[0]}:{vals[1]}')
-        self.load_items()
-        self.update_reports()
+        self._async(delete_collateral, vals[0], on_done=lambda _: self._item_written(
+            'delete_collateral', f'{vals[0]}:{vals[1]}', f'Item {vals[1]} deleted'))
 
     def increase_qty(self):
-        sel = self.item_tree.selection()
-        if not sel:
+        vals = self.item_tree.selected_row()
+        if vals is None:
             messagebox.showwarning('No selection', 'Please select an item.')
             return
-        vals = self.item_tree.item(sel[0])['values']
         amt = simpledialog.askinteger('Increase Qty', 'Amount to increase by:', minvalue=1, parent=self)
         if not amt:
             return
-        newq = spend_collateral(vals[0], abs(amt), self.selected_event_id)
-        log_action('ui', 'spend_collateral', f'{vals[0]}:+{amt}')
-        messagebox.showinfo('Success', f'New qty: {newq}')
-        self.load_items()
-        self.update_reports()
+        self._async(spend_collateral, vals[0], abs(amt), self.selected_event_id, on_done=lambda newq: self._item_written(
+            'spend_collateral', f'{vals[0]}:+{amt}', f'{vals[1]}: new qty {newq}'))
 
     def decrease_qty(self):
-        sel = self.item_tree.selection()
-        if not sel:
+        vals = self.item_tree.selected_row()
+        if vals is None:
             messagebox.showwarning('No selection', 'Please select an item.')
             return
-        vals = self.item_tree.item(sel[0])['values']
         maxv = vals[2] if len(vals) > 2 else None
         amt = simpledialog.askinteger('Decrease Qty', 'Amount to decrease by:', minvalue=1, maxvalue=maxv, parent=self)
         if not amt:
             return
-        newq = spend_collateral(vals[0], -abs(amt), self.selected_event_id)
-        log_action('ui', 'spend_collateral', f'{vals[0]}:-{amt}')
-        messagebox.showinfo('Success', f'New qty: {newq}')
-        self.load_items()
-        self.update_reports()
+        self._async(spend_collateral, vals[0], -abs(amt), self.selected_event_id, on_done=lambda newq: self._item_written(
+            'spend_collateral', f'{vals[0]}:-{amt}', f'{vals[1]}: new qty {newq}'))
+
+    def _item_written(self, action, details, status):
+        # completion of an item write that ran on the DB worker
+        log_action('ui', action, details)
+        self.request_refresh('items', 'reports', status=status)
 
     # ----------------------------
     # Reports tab
@@ -451,8 +810,8 @@ class InventoryApp(ttk.Window):
         self.summary_text = ttk.Label(frame, text='', font=('Segoe UI', 12), anchor=W, justify=LEFT)
         self.summary_text.pack(fill=BOTH, expand=True, pady=8)
 
-    def update_reports(self):
-        s = show_summary()
+    def update_reports(self, s):
+        # s: show_summary() result, read on the DB worker by snapshot()
         txt = f"Total Events: {s['total_events']}\nTotal Item Types: {s['total_items']}\nTotal Quantity: {s['total_quantity']}"
         self.summary_text.config(text=txt)
 
@@ -465,29 +824,46 @@ class InventoryApp(ttk.Window):
         ttk.Button(header, text='Refresh', bootstyle='info', command=self.load_logs).pack(side=RIGHT)
         ttk.Label(header, text='Action Logs', font=('Segoe UI', 14, 'bold')).pack(side=LEFT)
 
-        cols = ('ID', 'When', 'Actor', 'Action', 'Details')
-        self.logs_tree = ttk.Treeview(self.logs_tab, columns=cols, show='headings', height=18)
-        for c in cols:
-            self.logs_tree.heading(c, text=c)
-            self.logs_tree.column(c, width=120)
-        self.logs_tree.pack(fill=BOTH, expand=True, padx=12, pady=6)
-
-    def _populate_logs(self, txs_only=None):
-        # txs_only: optional sequence of transaction rows (id, delta, timestamp, event_name)
-        for r in self.logs_tree.get_children():
-            self.logs_tree.delete(r)
-        if txs_only:
-            for i, t in enumerate(txs_only):
-                self.logs_tree.insert('', END, values=(t[0], t[2], '-', f'delta={t[1]}', t[3] or '-'))
+        self.logs_tree = scrolled_tree(self.logs_tab, LOG_COLS, show='headings', height=18, on_end=self._on_logs_end)
+
+    def _populate_logs(self, txs_only=None, logs=None):
+        # txs_only: transaction rows (id, delta, timestamp, event_name) of the
+        # selected item, possibly none; otherwise logs: view_logs rows
+        self._logs_loaded = True
+        self._logs_fetching = False
+        if txs_only is not None:
+            self._log_rows = None
+            self.logs_tree.set_data([(t[0], t[2], '-', f'delta={t[1]}', t[3] or '-') for t in txs_only])
             return
-        rows = view_logs(200)
-        for r in rows:
-            self.logs_tree.insert('', END, values=r)
+        self._log_rows = [tuple(r) for r in logs]
+        self._logs_more = len(self._log_rows) == self.LOGS_PAGE
+        self.logs_tree.set_data(self._log_rows)
 
     def load_logs(self):
-        self._populate_logs()
+        self._async(view_logs, self.LOGS_PAGE, on_done=self._on_logs_loaded)
+
+    def _on_logs_loaded(self, rows):
+        self._populate_logs(logs=rows)
         self.update_status('Logs refreshed')
 
+    def _on_logs_end(self):
+        # logs tree scrolled to its last row: fetch the next older page
+        if self._log_rows is None or not self._logs_more or self._logs_fetching:
+            return
+        self._logs_fetching = True
+        before = self._log_rows[-1][0]
+        self._async(view_logs, self.LOGS_PAGE, before, on_done=lambda rows: self._append_logs(before, rows))
+
+    def _append_logs(self, before, rows):
+        if self._log_rows is None or self._log_rows[-1][0] != before:
+            # the tree was refilled (or switched to transactions) meanwhile
+            return
+        self._logs_fetching = False
+        rows = [tuple(r) for r in rows]
+        self._logs_more = len(rows) == self.LOGS_PAGE
+        self._log_rows.extend(rows)
+        self.logs_tree.set_data(self._log_rows)
+
 
 # ----------------------------
 # Entrypoint